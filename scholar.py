@@ -17,22 +17,49 @@ Usage:
 """
 
 import argparse
+import bisect
+import contextlib
+import hashlib
+import io
 import json
+import os
 import random
 import re
+import struct
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
 from pathlib import Path
-from urllib.parse import quote, unquote
+from urllib.parse import quote, unquote, urlparse
 
-import requests
+try:
+    import orjson  # optional — faster JSON encoding/decoding; stdlib json is the fallback
+except ImportError:
+    orjson = None
 
 # ---------------------------------------------------------------------------
 # Configuration
 # ---------------------------------------------------------------------------
 
-DOI_REGEX = re.compile(r"(10\.\d{4,9}/[^\s\"'<>\]\)}{,]+)", re.IGNORECASE)
+_DOI_PATTERN = r"(10\.\d{4,9}/[^\s\"'<>\]\)}{,]+)"
+# RE2's \s is ASCII-only, so its pattern also stops at the other characters
+# Python's \s matches: Unicode separators (no-break and thin spaces are
+# common in PDF text), vertical tab, NEL and the \x1c-\x1f separators
+_RE2_DOI_PATTERN = r"(10\.\d{4,9}/[^\s\pZ\x0b\x1c-\x1f\x85\"'<>\]\)}{,]+)"
+try:
+    # Optional linear-time engine for scanning PDF text. The pattern has no
+    # letters, so it needs no case-insensitive flag (re2 doesn't take one).
+    import re2
+    DOI_REGEX = re2.compile(_RE2_DOI_PATTERN)
+except ImportError:
+    DOI_REGEX = re.compile(_DOI_PATTERN, re.IGNORECASE)
+
+ARXIV_DOI_REGEX = re.compile(r"10\.48550/arXiv\.(.+)", re.IGNORECASE)
+BARE_DOI_REGEX = re.compile(r"10\.\d{4,9}/\S+")  # a whole argument that is just a DOI
+_WS_RE = re.compile(r"\s+")  # whitespace runs, collapsed in titles and abstracts
 
 # Browser User-Agent — blend in with normal traffic
 USER_AGENT = (
@@ -41,42 +68,124 @@ USER_AGENT = (
     "Chrome/122.0.0.0 Safari/537.36"
 )
 
+OUTPUT_DIR = Path(__file__).parent / "output"  # default report location when -o isn't given
+
 # Rate limiting — conservative, one invocation = many API calls across sources
 RATE_LIMIT_FILE = Path(__file__).parent / ".rate_limit_log"
 MIN_INTERVAL_SECONDS = 5
-MAX_REQUESTS_PER_HOUR = 10
-API_CALL_DELAY_MIN = 0.5
-API_CALL_DELAY_MAX = 2.0
+MAX_REQUESTS_PER_HOUR = 10  # token-bucket capacity; refills at this many per hour
+HOST_MIN_INTERVAL = 1.0  # seconds between calls to the same host, unless it advertises a rate
+MAX_CONCURRENT_PAPERS = 4  # papers fetched at once in batch mode
+CROSSREF_MAX_CONCURRENT = 2  # CrossRef's public pool also limits parallel requests
+
+# Hosts with a faster "polite pool" for clients that send a mailto= contact
+POLITE_POOL_HOSTS = {"api.crossref.org", "api.openalex.org"}
+RETRY_AFTER_MAX = 60  # cap on a server-requested Retry-After wait
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+RETRY_BACKOFF_BASE = 1.0  # seconds; doubles each attempt
+
+# Response cache (needs the optional diskcache package). TTLs are per host:
+# metadata rarely changes, citation counts drift daily, comments hourly.
+CACHE_DIR = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "lazy-scholar"
+CACHE_TTL_DEFAULT = 24 * 3600
+CACHE_TTLS = {
+    "api.crossref.org": 7 * 24 * 3600,
+    "eutils.ncbi.nlm.nih.gov": 7 * 24 * 3600,
+    "api.openalex.org": 24 * 3600,
+    "api.semanticscholar.org": 24 * 3600,
+    "www.ebi.ac.uk": 24 * 3600,
+    "pubpeer.com": 3600,
+    "hypothes.is": 3600,
+}
+NEGATIVE_CACHE_TTL = 30 * 24 * 3600  # "not in PubMed" rarely changes
+CACHE_STALE_KEEP = 30 * 24 * 3600  # how long expired entries with an ETag/Last-Modified are kept for revalidation
+
+# DOI prefixes that PubMed and PubPeer don't cover (arXiv, ACM placeholder DOIs);
+# lookups for these are skipped without a request
+NON_BIOMEDICAL_DOI_PREFIXES = {"10.48550", "10.5555"}
+
+
+# ---------------------------------------------------------------------------
+# JSON
+# ---------------------------------------------------------------------------
+
+def _json_loads(data: bytes):
+    """Decode JSON bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _write_json(obj, pretty: bool = True) -> None:
+    """Write obj to stdout as UTF-8 JSON, indented unless pretty is False,
+    using orjson when it's installed."""
+    if orjson is None:
+        # json.dump encodes incrementally instead of building one big string
+        json.dump(obj, sys.stdout, ensure_ascii=False, default=str,
+                  indent=2 if pretty else None, separators=None if pretty else (",", ":"))
+        print()
+        return
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    if pretty:
+        option |= orjson.OPT_INDENT_2
+    sys.stdout.flush()  # anything already printed through the text layer goes first
+    sys.stdout.buffer.write(orjson.dumps(obj, default=str, option=option))
+    sys.stdout.buffer.flush()
 
 
 # ---------------------------------------------------------------------------
 # Rate limiting
 # ---------------------------------------------------------------------------
 
-def check_rate_limit():
-    """Enforce rate limits."""
+# The rate-limit file holds the token bucket as two little-endian doubles:
+# (tokens left, time of the last invocation)
+_BUCKET_FORMAT = "<dd"
+_BUCKET_FILL_RATE = MAX_REQUESTS_PER_HOUR / 3600.0  # tokens per second
+
+
+def _load_bucket() -> tuple[float, float]:
+    """Read the bucket state; a missing or unreadable file means a full bucket."""
+    try:
+        data = RATE_LIMIT_FILE.read_bytes()
+    except OSError:
+        return float(MAX_REQUESTS_PER_HOUR), 0.0
+    if data.startswith(b"["):
+        legacy = _bucket_from_timestamps(data)
+        if legacy is not None:
+            return legacy
+    try:
+        return struct.unpack(_BUCKET_FORMAT, data)
+    except struct.error:
+        return float(MAX_REQUESTS_PER_HOUR), 0.0
+
+
+def _bucket_from_timestamps(data: bytes) -> tuple[float, float] | None:
+    """Convert the old rate-limit file (a JSON list of invocation timestamps)
+    into bucket state, so upgrading doesn't hand out a fresh bucket."""
+    window_start = time.time() - 3600
+    try:
+        timestamps = sorted(_json_loads(data))
+        recent = timestamps[bisect.bisect_left(timestamps, window_start):]
+    except (ValueError, TypeError):
+        return None
+    if not recent:
+        return float(MAX_REQUESTS_PER_HOUR), 0.0
+    return float(max(MAX_REQUESTS_PER_HOUR - len(recent), 0)), recent[-1]
+
+
+def _bucket_tokens(tokens: float, last: float, now: float) -> float:
+    """Tokens available at `now` after refilling since `last`."""
+    return min(float(MAX_REQUESTS_PER_HOUR), tokens + max(now - last, 0.0) * _BUCKET_FILL_RATE)
+
+
+def acquire_token():
+    """Enforce rate limits: take one token from the bucket for this invocation."""
+    tokens, last = _load_bucket()
     now = time.time()
-    window = 3600
 
-    timestamps = []
-    if RATE_LIMIT_FILE.exists():
-        try:
-            timestamps = json.loads(RATE_LIMIT_FILE.read_text())
-        except (json.JSONDecodeError, OSError):
-            timestamps = []
-
-    timestamps = [ts for ts in timestamps if now - ts < window]
-
-    if timestamps:
-        elapsed = now - max(timestamps)
-        if elapsed < MIN_INTERVAL_SECONDS:
-            wait = MIN_INTERVAL_SECONDS - elapsed
-            print(f"Rate limit: waiting {wait:.1f}s between requests...")
-            time.sleep(wait)
-
-    if len(timestamps) >= MAX_REQUESTS_PER_HOUR:
-        oldest = min(timestamps)
-        retry_after = window - (now - oldest)
+    tokens = _bucket_tokens(tokens, last, now)
+    if tokens < 1:
+        retry_after = (1 - tokens) / _BUCKET_FILL_RATE
         print(
             f"Rate limit reached ({MAX_REQUESTS_PER_HOUR} lookups/hour). "
             f"Try again in {retry_after / 60:.0f} minute(s).",
@@ -84,27 +193,93 @@ def check_rate_limit():
         )
         sys.exit(1)
 
+    elapsed = max(now - last, 0.0)
+    if elapsed < MIN_INTERVAL_SECONDS:
+        wait = MIN_INTERVAL_SECONDS - elapsed
+        print(f"Rate limit: waiting {wait:.1f}s between requests...", file=sys.stderr)
+        time.sleep(wait)
+        now = time.time()
 
-def record_request():
-    """Record one invocation timestamp."""
-    now = time.time()
-    window = 3600
+    _write_atomic(RATE_LIMIT_FILE, struct.pack(_BUCKET_FORMAT, tokens - 1, now))
 
-    timestamps = []
-    if RATE_LIMIT_FILE.exists():
+
+def _write_atomic(path: Path, data: bytes):
+    """Write via a synced sibling temp file and os.replace, so an interrupted
+    write can't leave a truncated file. Silently skipped on a read-only FS."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    try:
+        fd = os.open(tmp, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
-            timestamps = json.loads(RATE_LIMIT_FILE.read_text())
-        except (json.JSONDecodeError, OSError):
-            timestamps = []
+            os.write(fd, data)
+            os.fsync(fd)
+        finally:
+            os.close(fd)
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
 
-    timestamps = [ts for ts in timestamps if now - ts < window]
-    timestamps.append(now)
-    RATE_LIMIT_FILE.write_text(json.dumps(timestamps))
+class RateLimiter:
+    """Thread-safe token bucket for one host; acquire() blocks until the
+    caller's turn.  Waiters reserve tokens ahead, so concurrent callers queue
+    up instead of all waking at once."""
 
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate  # tokens per second
+        self._tokens = capacity
+        self._last = time.monotonic()
+        self._lock = threading.Lock()
 
-def _polite_delay():
-    """Random delay between API calls."""
-    time.sleep(random.uniform(API_CALL_DELAY_MIN, API_CALL_DELAY_MAX))
+    def acquire(self):
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.capacity, self._tokens + (now - self._last) * self.refill_rate)
+            self._last = now
+            self._tokens -= 1
+            wait = -self._tokens / self.refill_rate if self._tokens < 0 else 0.0
+        if wait:
+            _INTERRUPTED.wait(wait)  # a plain sleep, cut short by Ctrl-C
+
+    def update(self, limit: int, interval: float):
+        """Switch to a server-advertised rate of `limit` calls per `interval` seconds."""
+        with self._lock:
+            self.refill_rate = limit / interval
+
+
+_CROSSREF_SLOTS = threading.BoundedSemaphore(CROSSREF_MAX_CONCURRENT)
+
+_HOST_LIMITERS: dict[str, RateLimiter] = {}
+_HOST_LIMITERS_LOCK = threading.Lock()
+
+
+def _host_limiter(host: str) -> RateLimiter:
+    """Get the host's limiter; new hosts start at one call per HOST_MIN_INTERVAL."""
+    with _HOST_LIMITERS_LOCK:
+        if host not in _HOST_LIMITERS:
+            _HOST_LIMITERS[host] = RateLimiter(capacity=1, refill_rate=1 / HOST_MIN_INTERVAL)
+        return _HOST_LIMITERS[host]
+
+
+def _adapt_rate_limit(limiter: RateLimiter, resp):
+    """Follow X-Rate-Limit-Limit / X-Rate-Limit-Interval (e.g. "50" / "1s"),
+    which CrossRef sends on every response."""
+    limit = resp.headers.get("X-Rate-Limit-Limit")
+    interval = resp.headers.get("X-Rate-Limit-Interval")
+    if not (limit and interval):
+        return
+    units = {"s": 1, "m": 60, "h": 3600}
+    interval = interval.strip()
+    try:
+        limit = int(limit)
+        if interval[-1:] in units:
+            seconds = float(interval[:-1]) * units[interval[-1]]
+        else:
+            seconds = float(interval)
+    except ValueError:
+        return
+    if limit > 0 and seconds > 0:
+        limiter.update(limit, seconds)
 
 
 # ---------------------------------------------------------------------------
@@ -115,11 +290,24 @@ _PROXY_FORCE: bool | None = None  # None = use config, True = force on, False =
 
 
 def _load_proxy_config() -> dict:
-    """Load proxy configuration from ~/.scholar-proxies.json."""
+    """Load proxy configuration from ~/.scholar-proxies.json.
+
+    This runs before every HTTP call, so the parsed file is memoized on its
+    mtime and only re-read when it changes.
+    """
     config_path = Path.home() / ".scholar-proxies.json"
     try:
-        return json.loads(config_path.read_text())
-    except (FileNotFoundError, json.JSONDecodeError, OSError):
+        mtime = config_path.stat().st_mtime
+    except OSError:
+        return {"enabled": False, "proxies": []}
+    return _read_proxy_config(str(config_path), mtime)
+
+
+@lru_cache(maxsize=1)
+def _read_proxy_config(path: str, mtime: float) -> dict:
+    try:
+        return _json_loads(Path(path).read_bytes())
+    except (json.JSONDecodeError, OSError):
         return {"enabled": False, "proxies": []}
 
 
@@ -136,47 +324,195 @@ def _get_proxy() -> dict | None:
     return {"http": url, "https": url}
 
 
-def _get(url, params=None, headers=None, timeout=30, retries=2):
-    """GET with default headers and 429 retry."""
-    h = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+# ---------------------------------------------------------------------------
+# Response cache
+# ---------------------------------------------------------------------------
+
+_CACHE = None  # diskcache.Cache once opened, None = caching disabled
+_CACHE_REFRESH = False  # True = skip cache reads but still store fresh responses
+
+
+def _open_cache():
+    """Open the on-disk response cache, or return None if diskcache is missing."""
+    try:
+        import diskcache
+    except ImportError:
+        return None
+    try:
+        return diskcache.Cache(str(CACHE_DIR))
+    except OSError:
+        return None
+
+
+def _cache_key(*parts) -> str:
+    return hashlib.blake2b(repr(parts).encode()).hexdigest()
+
+
+def _cache_get(key):
+    """Read a cache entry; None if caching is off, the key is missing, or the
+    cache can't be read.  A broken cache only ever costs a refetch."""
+    if _CACHE is None:
+        return None
+    try:
+        return _CACHE.get(key)
+    except Exception:
+        return None
+
+
+def _cache_set(key, value, expire: float) -> None:
+    """Store a cache entry, ignoring failures (disk full, locked database)."""
+    if _CACHE is None:
+        return
+    try:
+        _CACHE.set(key, value, expire=expire)
+    except Exception:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# HTTP
+# ---------------------------------------------------------------------------
+
+_MAILTO: str | None = None  # contact address for the polite pools, opt-in via --mailto
+_INTERRUPTED = threading.Event()  # set on Ctrl-C; fetches still in flight stop sending requests
+
+# One session for every call, so each host's TLS connection is reused. Sized
+# for batch mode (several papers x several sources at once); retries stay in
+# _request so Retry-After and backoff are handled in one place. It's built on
+# first use: importing requests is most of the start-up time, and --help or a
+# bad argument never needs the network.
+_SESSION = None
+_SESSION_LOCK = threading.Lock()
+
+
+def _session():
+    """Return the shared HTTP session, creating it on first call."""
+    global _SESSION
+    if _SESSION is None:
+        with _SESSION_LOCK:
+            if _SESSION is None:
+                import requests
+                from requests.adapters import HTTPAdapter
+
+                session = requests.Session()
+                session.headers.update({"User-Agent": USER_AGENT, "Accept": "application/json"})
+                adapter = HTTPAdapter(pool_connections=16, pool_maxsize=32, max_retries=0)
+                session.mount("http://", adapter)
+                session.mount("https://", adapter)
+                _SESSION = session
+    return _SESSION
+
+
+def _request(method, url, params=None, json_data=None, headers=None, timeout=30, retries=3):
+    """Send a request with default headers, retrying 429/5xx and network errors.
+
+    Successful responses are cached per (method, URL, params, body) with a
+    TTL chosen by host; a fresh cache hit returns without touching the
+    network.  A stale entry that has an ETag or Last-Modified is revalidated
+    with a conditional request, and a 304 reuses the cached body.
+    """
+    key = _cache_key(method, url, sorted((params or {}).items()),
+                     json.dumps(json_data, sort_keys=True))
+    entry = _cache_get(key)
+    if entry is not None and not _CACHE_REFRESH and time.time() < entry["fresh_until"]:
+        return entry["data"]
+
+    h = {"Content-Type": "application/json"} if method == "POST" else {}
+    if entry is not None:
+        if entry["etag"]:
+            h["If-None-Match"] = entry["etag"]
+        if entry["last_modified"]:
+            h["If-Modified-Since"] = entry["last_modified"]
     if headers:
         h.update(headers)
+    host = urlparse(url).netloc
+    if _MAILTO and host in POLITE_POOL_HOSTS:
+        params = {**(params or {}), "mailto": _MAILTO}
+    session = _session()  # outside the retry loop: a missing requests isn't a network error
+    limiter = _host_limiter(host)
+    slots = _CROSSREF_SLOTS if host == "api.crossref.org" else contextlib.nullcontext()
     for attempt in range(retries + 1):
-        try:
-            resp = requests.get(url, params=params, headers=h, timeout=timeout, proxies=_get_proxy())
-            if resp.ok:
-                return resp.json()
-            if resp.status_code == 429 and attempt < retries:
-                time.sleep(random.uniform(3, 8))
-                continue
+        limiter.acquire()
+        if _INTERRUPTED.is_set():
             return None
+        try:
+            with slots:
+                resp = session.request(method, url, json=json_data, params=params, headers=h,
+                                       timeout=timeout, proxies=_get_proxy())
+            _adapt_rate_limit(limiter, resp)
+            revalidated = resp.status_code == 304 and entry is not None
+            data = _json_loads(resp.content) if resp.ok and not revalidated else None
         except Exception:
             if attempt < retries:
-                time.sleep(2)
-                continue
+                _INTERRUPTED.wait(_backoff(attempt))
+            continue
+
+        # Only network and decode errors are retried; the response is good
+        # from here on, whatever happens to the cache write
+        if revalidated:
+            _cache_response(key, host, entry["data"],
+                            resp.headers.get("ETag") or entry["etag"],
+                            resp.headers.get("Last-Modified") or entry["last_modified"])
+            return entry["data"]
+        if resp.ok:
+            if resp.status_code == 200:
+                _cache_response(key, host, data, resp.headers.get("ETag"),
+                                resp.headers.get("Last-Modified"))
+            return data
+        if resp.status_code in RETRY_STATUSES and attempt < retries:
+            wait = _retry_after(resp)
+            _INTERRUPTED.wait(wait if wait is not None else _backoff(attempt))
+            continue
+        return None
     return None
 
 
-def _post(url, json_data=None, params=None, headers=None, timeout=30, retries=2):
-    """POST with default headers and 429 retry."""
-    h = {"User-Agent": USER_AGENT, "Accept": "application/json",
-         "Content-Type": "application/json"}
-    if headers:
-        h.update(headers)
-    for attempt in range(retries + 1):
+def _cache_response(key, host, data, etag, last_modified):
+    """Store a response.  It's served from cache until its host's TTL runs
+    out; entries with validators are kept longer so they can be revalidated."""
+    ttl = CACHE_TTLS.get(host, CACHE_TTL_DEFAULT)
+    entry = {
+        "data": data,
+        "fresh_until": time.time() + ttl,
+        "etag": etag,
+        "last_modified": last_modified,
+    }
+    keep = ttl + CACHE_STALE_KEEP if etag or last_modified else ttl
+    _cache_set(key, entry, keep)
+
+
+def _backoff(attempt: int) -> float:
+    """Exponential backoff with up to a second of jitter."""
+    return RETRY_BACKOFF_BASE * 2 ** attempt + random.uniform(0, 1)
+
+
+def _retry_after(resp) -> float | None:
+    """Seconds to wait per the Retry-After header (delay or HTTP date),
+    capped at RETRY_AFTER_MAX; None if absent or unparseable."""
+    value = resp.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        seconds = float(value)
+    except ValueError:
+        from email.utils import parsedate_to_datetime
+
         try:
-            resp = requests.post(url, json=json_data, params=params, headers=h, timeout=timeout, proxies=_get_proxy())
-            if resp.ok:
-                return resp.json()
-            if resp.status_code == 429 and attempt < retries:
-                time.sleep(random.uniform(3, 8))
-                continue
+            seconds = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
             return None
-        except Exception:
-            if attempt < retries:
-                time.sleep(2)
-                continue
-    return None
+    return min(max(seconds, 0.0), RETRY_AFTER_MAX)
+
+
+def _get(url, params=None, headers=None, timeout=30, retries=3):
+    """GET with default headers, retries, and response caching."""
+    return _request("GET", url, params=params, headers=headers, timeout=timeout, retries=retries)
+
+
+def _post(url, json_data=None, params=None, headers=None, timeout=30, retries=3):
+    """POST with default headers, retries, and response caching."""
+    return _request("POST", url, params=params, json_data=json_data, headers=headers,
+                    timeout=timeout, retries=retries)
 
 
 # ---------------------------------------------------------------------------
@@ -195,6 +531,12 @@ def extract_doi(text: str) -> str | None:
     return None
 
 
+@lru_cache(maxsize=256)
+def _quote_doi(doi: str) -> str:
+    """Percent-encode a DOI as a single URL path segment (shared by the fetchers)."""
+    return quote(doi, safe="")
+
+
 def extract_doi_from_url(url: str) -> str | None:
     url = unquote(url)
     if "doi.org/" in url:
@@ -203,7 +545,8 @@ def extract_doi_from_url(url: str) -> str | None:
 
 
 def extract_doi_from_pdf(pdf_path: str) -> str | None:
-    from pdfminer.high_level import extract_text
+    from pdfminer.high_level import extract_pages
+    from pdfminer.layout import LTContainer, LTText
     from pdfminer.pdfparser import PDFParser
     from pdfminer.pdfdocument import PDFDocument
 
@@ -220,6 +563,8 @@ def extract_doi_from_pdf(pdf_path: str) -> str | None:
                 for key in ("doi", "Subject", "Title", "WPS-ARTICLEDOI"):
                     val = meta.get(key, b"")
                     if isinstance(val, bytes):
+                        if b"10." not in val:
+                            continue
                         val = val.decode("utf-8", errors="ignore")
                     doi = extract_doi(str(val))
                     if doi:
@@ -227,9 +572,22 @@ def extract_doi_from_pdf(pdf_path: str) -> str | None:
     except Exception:
         pass
 
+    def layout_text(item):
+        # Recurse like extract_text does: header/footer DOIs are often drawn
+        # inside figures (Form XObjects), not top-level text boxes
+        if isinstance(item, LTText):
+            yield item.get_text()
+        elif isinstance(item, LTContainer):
+            for child in item:
+                yield from layout_text(child)
+
+    # Lay out one page at a time and stop at the first DOI (usually page 1)
     try:
-        text = extract_text(str(pdf_file), maxpages=3)
-        return extract_doi(text)
+        for page in extract_pages(str(pdf_file), maxpages=3):
+            text = "".join(layout_text(page))
+            doi = extract_doi(text)
+            if doi:
+                return doi
     except Exception:
         pass
 
@@ -242,14 +600,24 @@ def extract_doi_from_pdf(pdf_path: str) -> str | None:
 
 def fetch_crossref(doi: str) -> dict | None:
     """Fetch paper metadata from CrossRef."""
-    data = _get(f"https://api.crossref.org/works/{quote(doi, safe='')}")
+    data = _get(f"https://api.crossref.org/works/{_quote_doi(doi)}")
     if data and "message" in data:
         return data["message"]
     return None
 
 
 def search_crossref(title: str, rows: int = 3) -> list:
-    """Search CrossRef by title."""
+    """Search CrossRef by title.
+
+    CrossRef's title search ignores case and spacing, so the query is
+    normalized first; retyping a title differently then hits the response
+    cache instead of CrossRef.
+    """
+    return list(_search_crossref(_WS_RE.sub(" ", title).strip().casefold(), rows))
+
+
+@lru_cache(maxsize=1024)
+def _search_crossref(title: str, rows: int) -> tuple:
     data = _get(
         "https://api.crossref.org/works",
         params={
@@ -259,8 +627,8 @@ def search_crossref(title: str, rows: int = 3) -> list:
         },
     )
     if data and "message" in data:
-        return data["message"].get("items", [])
-    return []
+        return tuple(data["message"].get("items", []))
+    return ()
 
 
 # ---------------------------------------------------------------------------
@@ -269,31 +637,54 @@ def search_crossref(title: str, rows: int = 3) -> list:
 
 def fetch_openalex(doi: str) -> dict | None:
     """Fetch paper data from OpenAlex."""
-    return _get(f"https://api.openalex.org/works/https://doi.org/{quote(doi, safe='')}")
+    return _get(f"https://api.openalex.org/works/https://doi.org/{_quote_doi(doi)}")
 
 
 # ---------------------------------------------------------------------------
 # API: Semantic Scholar
 # ---------------------------------------------------------------------------
 
+S2_FIELDS = "paperId,title,citationCount,influentialCitationCount,isOpenAccess,openAccessPdf,tldr,publicationTypes,publicationDate,journal,authors"
+S2_BATCH_SIZE = 500  # max IDs per /paper/batch request
+
+
 def fetch_semantic_scholar(doi: str) -> dict | None:
     """Fetch paper data from Semantic Scholar."""
-    fields = "paperId,title,citationCount,influentialCitationCount,isOpenAccess,openAccessPdf,tldr,publicationTypes,publicationDate,journal,authors"
     data = _get(
-        f"https://api.semanticscholar.org/graph/v1/paper/DOI:{quote(doi, safe='')}",
-        params={"fields": fields},
+        f"https://api.semanticscholar.org/graph/v1/paper/DOI:{_quote_doi(doi)}",
+        params={"fields": S2_FIELDS},
     )
     # If DOI lookup failed and this is an arXiv DOI, try ArXiv:ID format
     if not data:
-        m = re.match(r"10\.48550/arXiv\.(.+)", doi, re.IGNORECASE)
+        m = ARXIV_DOI_REGEX.match(doi)
         if m:
             data = _get(
                 f"https://api.semanticscholar.org/graph/v1/paper/ArXiv:{m.group(1)}",
-                params={"fields": fields},
+                params={"fields": S2_FIELDS},
             )
     return data
 
 
+def fetch_semantic_scholar_batch(dois: list[str]) -> dict[str, dict]:
+    """Fetch Semantic Scholar data for many DOIs in as few requests as possible.
+
+    Returns {doi: paper}; DOIs that Semantic Scholar doesn't know are omitted.
+    """
+    papers = {}
+    for i in range(0, len(dois), S2_BATCH_SIZE):
+        chunk = dois[i:i + S2_BATCH_SIZE]
+        data = _post(
+            "https://api.semanticscholar.org/graph/v1/paper/batch",
+            json_data={"ids": [f"DOI:{doi}" for doi in chunk]},
+            params={"fields": S2_FIELDS},
+        )
+        if isinstance(data, list):
+            for doi, paper in zip(chunk, data):
+                if paper:
+                    papers[doi] = paper
+    return papers
+
+
 def fetch_recommendations(paper_id: str, limit: int = 5) -> list:
     """Fetch recommended papers from Semantic Scholar."""
     data = _get(
@@ -309,8 +700,21 @@ def fetch_recommendations(paper_id: str, limit: int = 5) -> list:
 # API: PubMed / NCBI
 # ---------------------------------------------------------------------------
 
+def _is_non_biomedical(doi: str) -> bool:
+    return doi.split("/", 1)[0] in NON_BIOMEDICAL_DOI_PREFIXES
+
+
 def fetch_pubmed_id(doi: str) -> str | None:
-    """Look up PubMed ID for a DOI."""
+    """Look up PubMed ID for a DOI.
+
+    DOIs PubMed doesn't have are remembered for NEGATIVE_CACHE_TTL, so they
+    don't go back to NCBI on every lookup.
+    """
+    if _is_non_biomedical(doi):
+        return None
+    miss_key = _cache_key("pubmed-miss", doi.lower())
+    if not _CACHE_REFRESH and _cache_get(miss_key):
+        return None
     data = _get(
         "https://eutils.ncbi.nlm.nih.gov/entrez/eutils/esearch.fcgi",
         params={"db": "pubmed", "term": f"{doi}[doi]", "retmode": "json"},
@@ -319,6 +723,7 @@ def fetch_pubmed_id(doi: str) -> str | None:
         ids = data.get("esearchresult", {}).get("idlist", [])
         if ids:
             return ids[0]
+        _cache_set(miss_key, True, NEGATIVE_CACHE_TTL)
     return None
 
 
@@ -346,6 +751,8 @@ def fetch_pubmed_pmc(pmid: str) -> str | None:
 
 def fetch_pubpeer(doi: str) -> dict | None:
     """Fetch PubPeer comments for a DOI."""
+    if _is_non_biomedical(doi):
+        return None
     data = _post(
         "https://pubpeer.com/v3/publications",
         json_data={"version": "1.6.2", "browser": "Chrome", "dois": [doi]},
@@ -394,69 +801,79 @@ def fetch_hypothesis_count(doi: str) -> int:
 # Aggregator
 # ---------------------------------------------------------------------------
 
-def aggregate_paper_data(doi: str) -> dict:
-    """Fetch data from all sources and merge into a single report."""
-    report = {"doi": doi, "sources": {}}
-
-    print("  CrossRef...", end="", flush=True)
-    cr = fetch_crossref(doi)
-    if cr:
-        report["sources"]["crossref"] = cr
-    print(" done")
-
-    _polite_delay()
-    print("  OpenAlex...", end="", flush=True)
-    oa = fetch_openalex(doi)
-    if oa:
-        report["sources"]["openalex"] = oa
-    print(" done")
-
-    _polite_delay()
-    print("  Semantic Scholar...", end="", flush=True)
-    ss = fetch_semantic_scholar(doi)
-    if ss:
-        report["sources"]["semantic_scholar"] = ss
-    print(" done")
-
-    _polite_delay()
-    print("  PubMed...", end="", flush=True)
-    pmid = fetch_pubmed_id(doi)
-    if pmid:
-        report["pmid"] = pmid
-        pmc = fetch_pubmed_pmc(pmid)
-        if pmc:
-            report["pmc_id"] = pmc
-    print(" done")
-
-    _polite_delay()
-    print("  Europe PMC...", end="", flush=True)
-    epmc = fetch_europepmc(doi)
-    if epmc:
-        report["sources"]["europepmc"] = epmc
-    print(" done")
-
-    _polite_delay()
-    print("  PubPeer...", end="", flush=True)
-    pp = fetch_pubpeer(doi)
-    if pp:
-        report["sources"]["pubpeer"] = pp
-    print(" done")
-
-    _polite_delay()
-    print("  Hypothesis...", end="", flush=True)
-    hyp_count = fetch_hypothesis_count(doi)
-    report["hypothesis_annotations"] = hyp_count
-    print(" done")
-
-    # Recommendations from Semantic Scholar (if we got a paper ID)
-    if ss and ss.get("paperId"):
-        _polite_delay()
-        print("  Recommendations...", end="", flush=True)
-        recs = fetch_recommendations(ss["paperId"])
-        if recs:
-            report["recommendations"] = recs
-        print(" done")
+# (report key, progress label, fetcher) — all keyed on the DOI alone, so they
+# can run concurrently
+SOURCES = [
+    ("crossref", "CrossRef", fetch_crossref),
+    ("openalex", "OpenAlex", fetch_openalex),
+    ("semantic_scholar", "Semantic Scholar", fetch_semantic_scholar),
+    ("pmid", "PubMed", fetch_pubmed_id),
+    ("europepmc", "Europe PMC", fetch_europepmc),
+    ("pubpeer", "PubPeer", fetch_pubpeer),
+    ("hypothesis_annotations", "Hypothesis", fetch_hypothesis_count),
+]
+
+
+def _run_concurrently(pool, jobs, progress_tag="") -> dict:
+    """Run (key, label, fetcher, arg) jobs on the pool, reporting progress as
+    each one finishes.  Returns {key: result}."""
+    futures = {
+        pool.submit(fetcher, arg): (key, label)
+        for key, label, fetcher, arg in jobs
+    }
+    results = {}
+    for future in as_completed(futures):
+        key, label = futures[future]
+        results[key] = future.result()
+        print(f"  {progress_tag}{label}... done", file=sys.stderr, flush=True)
+    return results
+
+
+def _cancel_pool(pool) -> None:
+    """Stop work after Ctrl-C: drop queued jobs and make running ones give up
+    at their next request, so leaving the pool's with-block doesn't wait for
+    every remaining fetch."""
+    _INTERRUPTED.set()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def aggregate_paper_data(doi: str, semantic_scholar: dict | None = None,
+                         progress_tag: str = "") -> dict:
+    """Fetch data from all sources and merge into a single report.
+
+    Pass `semantic_scholar` when the paper was already fetched with
+    fetch_semantic_scholar_batch to skip the per-DOI lookup.  `progress_tag`
+    prefixes the progress lines, to tell papers apart when several are
+    fetched at once.
+    """
+    jobs = [
+        (key, label, fetcher, doi) for key, label, fetcher in SOURCES
+        if not (semantic_scholar and key == "semantic_scholar")
+    ]
+    with ThreadPoolExecutor(max_workers=len(SOURCES)) as pool:
+        results = _run_concurrently(pool, jobs, progress_tag)
+        if semantic_scholar:
+            results["semantic_scholar"] = semantic_scholar
+
+        # Second round: lookups that need an ID from the first round
+        followups = []
+        if results["pmid"]:
+            followups.append(("pmc_id", "PubMed Central", fetch_pubmed_pmc, results["pmid"]))
+        ss = results["semantic_scholar"]
+        if ss and ss.get("paperId"):
+            followups.append(("recommendations", "Recommendations", fetch_recommendations, ss["paperId"]))
+        results.update(_run_concurrently(pool, followups, progress_tag))
 
+    report = {"doi": doi, "sources": {}}
+    for key in ("crossref", "openalex", "semantic_scholar", "europepmc", "pubpeer"):
+        if results[key]:
+            report["sources"][key] = results[key]
+    for key in ("pmid", "pmc_id"):
+        if results.get(key):
+            report[key] = results[key]
+    report["hypothesis_annotations"] = results["hypothesis_annotations"]
+    if results.get("recommendations"):
+        report["recommendations"] = results["recommendations"]
     return report
 
 
@@ -464,10 +881,25 @@ def aggregate_paper_data(doi: str) -> dict:
 # Markdown output
 # ---------------------------------------------------------------------------
 
-def to_markdown(report: dict) -> str:
-    """Convert aggregated report to Markdown."""
-    lines = []
+_HTML_TAG_RE = re.compile(r"<[^>]+>")
+
+_CITATION_TABLE_HEADER = (
+    "## Citation Counts\n"
+    "\n"
+    "| Source | Citations | Notes |\n"
+    "|--------|-----------|-------|\n"
+)
+
+
+def to_markdown(report: dict, today: str | None = None) -> str:
+    """Convert aggregated report to Markdown.
+
+    `today` is the footer date; batch callers pass it so it's computed once.
+    """
+    buf = io.StringIO()
+    w = buf.write
     doi = report["doi"]
+    doi_q = quote(doi)  # URL-safe form for the links below
     cr = report["sources"].get("crossref", {})
     oa = report["sources"].get("openalex", {})
     ss = report["sources"].get("semantic_scholar", {})
@@ -479,11 +911,10 @@ def to_markdown(report: dict) -> str:
     if isinstance(title, list):
         title = title[0] if title else None
     title = title or ss.get("title") or oa.get("title") or epmc.get("title") or doi
-    lines.append(f"# {title}")
-    lines.append("")
+    w(f"# {title}\n\n")
 
     # Metadata
-    lines.append(f"**DOI:** [{doi}](https://doi.org/{doi})")
+    w(f"**DOI:** [{doi}](https://doi.org/{doi_q})\n")
 
     # Authors
     authors = _extract_authors(cr, oa, ss, epmc)
@@ -491,106 +922,91 @@ def to_markdown(report: dict) -> str:
         display = ", ".join(authors[:10])
         if len(authors) > 10:
             display += " *et al.*"
-        lines.append(f"**Authors:** {display}")
+        w(f"**Authors:** {display}\n")
 
     # Journal
     journal = _extract_journal(cr, ss, epmc)
     if journal:
-        lines.append(f"**Journal:** {journal}")
+        w(f"**Journal:** {journal}\n")
 
     # Date
     date = _extract_date(cr, ss, oa, epmc)
     if date:
-        lines.append(f"**Published:** {date}")
+        w(f"**Published:** {date}\n")
 
     # Type
     pub_type = cr.get("type") or (ss.get("publicationTypes") or [None])[0]
     if pub_type:
-        lines.append(f"**Type:** {pub_type}")
+        w(f"**Type:** {pub_type}\n")
 
     # PubMed
     pmid = report.get("pmid")
     if pmid:
-        lines.append(f"**PubMed:** [{pmid}](https://pubmed.ncbi.nlm.nih.gov/{pmid}/)")
+        w(f"**PubMed:** [{pmid}](https://pubmed.ncbi.nlm.nih.gov/{pmid}/)\n")
     pmc = report.get("pmc_id")
     if pmc:
-        lines.append(f"**PMC:** [PMC{pmc}](https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{pmc}/)")
+        w(f"**PMC:** [PMC{pmc}](https://www.ncbi.nlm.nih.gov/pmc/articles/PMC{pmc}/)\n")
 
-    lines.append("")
-    lines.append("---")
-    lines.append("")
+    w("\n---\n\n")
 
     # TLDR (Semantic Scholar)
     tldr = ss.get("tldr", {})
     if isinstance(tldr, dict) and tldr.get("text"):
-        lines.append("## TL;DR")
-        lines.append("")
-        lines.append(f"*{tldr['text']}*")
-        lines.append("")
+        w(f"## TL;DR\n\n*{tldr['text']}*\n\n")
 
     # Abstract
     abstract = cr.get("abstract") or epmc.get("abstractText")
     if abstract:
         # Strip HTML tags and collapse whitespace
-        abstract = re.sub(r"<[^>]+>", "", abstract)
-        abstract = re.sub(r"\s+", " ", abstract).strip()
-        lines.append("## Abstract")
-        lines.append("")
-        lines.append(abstract)
-        lines.append("")
+        abstract = _HTML_TAG_RE.sub("", abstract)
+        abstract = _WS_RE.sub(" ", abstract).strip()
+        w(f"## Abstract\n\n{abstract}\n\n")
 
     # Citation counts from multiple sources
-    lines.append("## Citation Counts")
-    lines.append("")
-    lines.append("| Source | Citations | Notes |")
-    lines.append("|--------|-----------|-------|")
+    w(_CITATION_TABLE_HEADER)
 
     cr_count = cr.get("is-referenced-by-count")
     if cr_count is not None:
-        lines.append(f"| CrossRef | {cr_count:,} | - |")
+        w(f"| CrossRef | {cr_count:,} | - |\n")
 
     oa_count = oa.get("cited_by_count")
     if oa_count is not None:
         percentile = oa.get("cited_by_percentile_year", {}).get("min")
         note = f"{percentile}th percentile for year" if percentile is not None else "-"
-        lines.append(f"| OpenAlex | {oa_count:,} | {note} |")
+        w(f"| OpenAlex | {oa_count:,} | {note} |\n")
 
     ss_count = ss.get("citationCount")
     if ss_count is not None:
         influential = ss.get("influentialCitationCount", 0)
         note = f"{influential} influential" if influential else "-"
-        lines.append(f"| Semantic Scholar | {ss_count:,} | {note} |")
+        w(f"| Semantic Scholar | {ss_count:,} | {note} |\n")
 
     epmc_count = epmc.get("citedByCount")
     if epmc_count is not None:
-        lines.append(f"| Europe PMC | {epmc_count:,} | - |")
+        w(f"| Europe PMC | {epmc_count:,} | - |\n")
 
-    lines.append("")
+    w("\n")
 
     # Open Access
     oa_urls = _extract_oa_links(cr, oa, ss, epmc, report)
     if oa_urls:
-        lines.append("## Open Access")
-        lines.append("")
+        w("## Open Access\n\n")
         for label, url in oa_urls:
-            lines.append(f"- [{label}]({url})")
-        lines.append("")
+            w(f"- [{label}]({url})\n")
+        w("\n")
 
     # Editorial notices / retractions
     notices = _extract_notices(cr)
     if notices:
-        lines.append("## Editorial Notices")
-        lines.append("")
+        w("## Editorial Notices\n\n")
         for notice in notices:
-            lines.append(f"- **{notice}**")
-        lines.append("")
+            w(f"- **{notice}**\n")
+        w("\n")
 
     # PubPeer
     if pp:
         comments = pp.get("total_comments", 0)
         if comments > 0:
-            lines.append("## PubPeer")
-            lines.append("")
             users = pp.get("users", "")
             if isinstance(users, (int, float)):
                 user_str = f"{int(users)} user{'s' if users != 1 else ''}"
@@ -598,61 +1014,52 @@ def to_markdown(report: dict) -> str:
                 user_str = users + " users"
             else:
                 user_str = ""
-            url = pp.get("url", f"https://pubpeer.com/search?q={doi}")
+            url = pp.get("url", f"https://pubpeer.com/search?q={doi_q}")
             comment_text = f"**{comments} comment{'s' if comments != 1 else ''}**"
             if user_str:
                 comment_text += f" from {user_str}"
-            lines.append(f"{comment_text} — [View on PubPeer]({url})")
-            lines.append("")
+            w(f"## PubPeer\n\n{comment_text} — [View on PubPeer]({url})\n\n")
 
     # Hypothesis
     hyp_count = report.get("hypothesis_annotations", 0)
     if hyp_count > 0:
-        lines.append("## Hypothesis Annotations")
-        lines.append("")
-        lines.append(f"**{hyp_count} annotation{'s' if hyp_count != 1 else ''}** — [View](https://hypothes.is/search?q=doi%3A{doi})")
-        lines.append("")
+        w("## Hypothesis Annotations\n\n")
+        w(f"**{hyp_count} annotation{'s' if hyp_count != 1 else ''}** — [View](https://hypothes.is/search?q=doi%3A{doi_q})\n\n")
 
     # Topics/concepts from OpenAlex
     concepts = oa.get("concepts", [])
     if concepts:
         top = [c for c in concepts if c.get("score", 0) > 0.3][:8]
         if top:
-            lines.append("## Topics")
-            lines.append("")
+            w("## Topics\n\n")
             for c in top:
                 score = c.get("score", 0)
-                lines.append(f"- {c.get('display_name', '?')} ({score:.0%})")
-            lines.append("")
+                w(f"- {c.get('display_name', '?')} ({score:.0%})\n")
+            w("\n")
 
     # Funders
     funders = cr.get("funder", [])
     if funders:
-        lines.append("## Funding")
-        lines.append("")
+        w("## Funding\n\n")
         for f in funders:
             name = f.get("name", "Unknown")
             awards = f.get("award", [])
             if awards:
-                lines.append(f"- {name} (grants: {', '.join(awards)})")
+                w(f"- {name} (grants: {', '.join(awards)})\n")
             else:
-                lines.append(f"- {name}")
-        lines.append("")
+                w(f"- {name}\n")
+        w("\n")
 
     # References count
     refs = cr.get("reference", [])
     if refs:
         ref_with_doi = sum(1 for r in refs if r.get("DOI"))
-        lines.append("## References")
-        lines.append("")
-        lines.append(f"**{len(refs)} references** ({ref_with_doi} with DOI)")
-        lines.append("")
+        w(f"## References\n\n**{len(refs)} references** ({ref_with_doi} with DOI)\n\n")
 
     # Recommendations
     recs = report.get("recommendations", [])
     if recs:
-        lines.append("## Recommended Papers")
-        lines.append("")
+        w("## Recommended Papers\n\n")
         for r in recs[:5]:
             r_title = r.get("title", "Untitled")
             r_authors = r.get("authors", [])
@@ -670,12 +1077,12 @@ def to_markdown(report: dict) -> str:
                 parts.append(str(r_year))
             if r_cite:
                 parts.append(f"{r_cite:,} citations")
-            lines.append(f"- {' — '.join(parts)}")
-        lines.append("")
+            w(f"- {' — '.join(parts)}\n")
+        w("\n")
 
-    lines.append("---")
-    lines.append(f"*Generated by Lazy Scholar CLI on {datetime.now().strftime('%Y-%m-%d')}*")
-    return "\n".join(lines)
+    w("---\n")
+    w(f"*Generated by Lazy Scholar CLI on {today or datetime.now().strftime('%Y-%m-%d')}*")
+    return buf.getvalue()
 
 
 def _extract_authors(cr, oa, ss, epmc) -> list[str]:
@@ -813,17 +1220,24 @@ def _extract_notices(cr) -> list[str]:
             notices.append(f"Has correction/erratum")
         elif "concern" in label:
             notices.append("Expression of concern")
+        if len(set(notices)) == 3:
+            break  # every kind of notice has been found
 
-    return list(set(notices))
+    # Dedupe keeping first-seen order, so RETRACTED stays on top
+    return list(dict.fromkeys(notices))
 
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
+_SLUG_RE = re.compile(r"[^a-z0-9]+")
+
+
+@lru_cache(maxsize=256)
 def slugify(text: str) -> str:
     slug = text.lower()
-    slug = re.sub(r"[^a-z0-9]+", "-", slug)
+    slug = _SLUG_RE.sub("-", slug)
     slug = slug.strip("-")
     return slug[:80] if slug else "report"
 
@@ -833,25 +1247,25 @@ def resolve_arxiv_doi(doi: str) -> str:
     find the canonical published DOI.  Falls back to CrossRef title search
     if S2 doesn't have the published DOI linked.  Returns the published DOI
     if found, otherwise the original."""
-    m = re.match(r"10\.48550/arXiv\.(.+)", doi, re.IGNORECASE)
+    m = ARXIV_DOI_REGEX.match(doi)
     if not m:
         return doi
     arxiv_id = m.group(1)
+    session = _session()
     title = None
     try:
-        resp = requests.get(
+        resp = session.get(
             f"https://api.semanticscholar.org/graph/v1/paper/ArXiv:{arxiv_id}",
             params={"fields": "externalIds,title"},
-            headers={"User-Agent": USER_AGENT},
             timeout=10,
             proxies=_get_proxy(),
         )
         if resp.ok:
-            data = resp.json()
+            data = _json_loads(resp.content)
             ext = data.get("externalIds") or {}
             published_doi = ext.get("DOI", "")
             if published_doi and published_doi.lower() != doi.lower():
-                print(f"  Resolved arXiv DOI → {published_doi}")
+                print(f"  Resolved arXiv DOI → {published_doi}", file=sys.stderr)
                 return published_doi
             title = data.get("title")
     except Exception:
@@ -859,20 +1273,19 @@ def resolve_arxiv_doi(doi: str) -> str:
     # Fallback: search CrossRef by title if S2 didn't have a published DOI
     if title:
         try:
-            cr_resp = requests.get(
+            cr_resp = session.get(
                 "https://api.crossref.org/works",
                 params={"query.title": title, "rows": 3},
-                headers={"User-Agent": USER_AGENT},
                 timeout=10,
                 proxies=_get_proxy(),
             )
             if cr_resp.ok:
-                items = cr_resp.json().get("message", {}).get("items", [])
+                items = _json_loads(cr_resp.content).get("message", {}).get("items", [])
                 for item in items:
                     cr_doi = item.get("DOI", "")
                     cr_title = (item.get("title") or [""])[0].lower()
                     if cr_doi and cr_doi.lower() != doi.lower() and title.lower() in cr_title:
-                        print(f"  Resolved arXiv DOI → {cr_doi} (via CrossRef title match)")
+                        print(f"  Resolved arXiv DOI → {cr_doi} (via CrossRef title match)", file=sys.stderr)
                         return cr_doi
         except Exception:
             pass
@@ -881,17 +1294,17 @@ def resolve_arxiv_doi(doi: str) -> str:
 
 def resolve_input(input_str: str) -> str | None:
     """Resolve input to a DOI."""
-    if input_str.startswith("10."):
+    if BARE_DOI_REGEX.fullmatch(input_str):
         return resolve_arxiv_doi(input_str)
     if input_str.startswith(("http://", "https://")):
         doi = extract_doi_from_url(input_str)
         return resolve_arxiv_doi(doi) if doi else None
     path = Path(input_str).expanduser()
     if path.exists() and path.suffix.lower() == ".pdf":
-        print(f"Extracting DOI from PDF: {path.name}")
+        print(f"Extracting DOI from PDF: {path.name}", file=sys.stderr)
         doi = extract_doi_from_pdf(str(path))
         if doi:
-            print(f"  Found DOI: {doi}")
+            print(f"  Found DOI: {doi}", file=sys.stderr)
             return resolve_arxiv_doi(doi)
         else:
             print(f"  No DOI found in PDF.", file=sys.stderr)
@@ -900,6 +1313,17 @@ def resolve_input(input_str: str) -> str | None:
     return resolve_arxiv_doi(doi) if doi else None
 
 
+def _classify_input(input_str: str) -> tuple[str, str]:
+    """argparse type for inputs: ("doi", doi) for a bare DOI that needs no
+    resolving, ("raw", input) for anything resolve_input has to handle."""
+    if BARE_DOI_REGEX.fullmatch(input_str) and not ARXIV_DOI_REGEX.match(input_str):
+        return "doi", input_str
+    if (input_str.startswith("10.") and not BARE_DOI_REGEX.fullmatch(input_str)
+            and not Path(input_str).expanduser().exists()):  # e.g. 10.1038_xyz.pdf
+        raise argparse.ArgumentTypeError(f"not a valid DOI: {input_str!r}")
+    return "raw", input_str
+
+
 # ---------------------------------------------------------------------------
 # Main
 # ---------------------------------------------------------------------------
@@ -911,6 +1335,7 @@ def main():
     parser.add_argument(
         "inputs",
         nargs="*",
+        type=_classify_input,
         help="DOIs, URLs, or PDF file paths",
     )
     parser.add_argument(
@@ -935,16 +1360,32 @@ def main():
                              help="Force proxy usage (overrides ~/.scholar-proxies.json)")
     proxy_group.add_argument("--no-proxy", dest="use_proxy", action="store_false",
                              help="Disable proxy (overrides ~/.scholar-proxies.json)")
+    parser.add_argument(
+        "--mailto",
+        default=os.environ.get("SCHOLAR_MAILTO"),
+        help="Contact email sent to CrossRef and OpenAlex to use their polite pool "
+             "(default: $SCHOLAR_MAILTO; off unless set)",
+    )
+    cache_group = parser.add_mutually_exclusive_group()
+    cache_group.add_argument("--no-cache", action="store_true",
+                             help="Don't read or write the response cache")
+    cache_group.add_argument("--refresh", action="store_true",
+                             help="Ignore cached responses and re-fetch (the cache is updated)")
     args = parser.parse_args()
+    _session()  # import requests now, so a missing install fails before any work
 
-    global _PROXY_FORCE
+    global _PROXY_FORCE, _CACHE, _CACHE_REFRESH, _MAILTO
     _PROXY_FORCE = args.use_proxy
+    _MAILTO = args.mailto
+    if not args.no_cache:
+        _CACHE = _open_cache()
+    _CACHE_REFRESH = args.refresh
 
     # Resolve DOIs
     dois = []
 
     if args.title:
-        print(f"Searching CrossRef for: \"{args.title}\"...")
+        print(f"Searching CrossRef for: \"{args.title}\"...", file=sys.stderr)
         results = search_crossref(args.title, rows=5)
         if not results:
             print("  No results found.", file=sys.stderr)
@@ -952,10 +1393,10 @@ def main():
 
         # If author provided, filter
         if args.author:
-            author_lower = args.author.lower()
+            author_key = args.author.casefold()
             filtered = [r for r in results if any(
-                author_lower in (a.get("family", "") or "").lower()
-                for a in r.get("author", [])
+                author_key in (a.get("family") or "").casefold()
+                for a in r.get("author", ())
             )]
             if filtered:
                 results = filtered
@@ -963,13 +1404,14 @@ def main():
         best = results[0]
         doi = best.get("DOI")
         best_title = best.get("title", [""])[0] if isinstance(best.get("title"), list) else best.get("title", "")
-        print(f"  Found: {best_title}")
-        print(f"  DOI: {doi}")
+        print(f"  Found: {best_title}", file=sys.stderr)
+        print(f"  DOI: {doi}", file=sys.stderr)
         if doi:
             dois.append(doi)
 
-    for inp in (args.inputs or []):
-        doi = resolve_input(inp)
+    # Drop repeated inputs first so a URL or PDF given twice is resolved once
+    for kind, inp in dict.fromkeys(args.inputs or []):
+        doi = inp if kind == "doi" else resolve_input(inp)
         if doi:
             dois.append(doi)
         else:
@@ -978,45 +1420,41 @@ def main():
     if not dois:
         parser.error("No DOIs found. Provide DOIs, URLs, PDFs, or use --title.")
 
-    # Deduplicate
-    seen = set()
-    unique = []
-    for d in dois:
-        if d not in seen:
-            seen.add(d)
-            unique.append(d)
-    dois = unique
-
-    check_rate_limit()
-    record_request()
-
-    # Process each DOI
-    reports = []
-    for i, doi in enumerate(dois):
-        if i > 0:
-            print()
-            time.sleep(random.uniform(3, 6))
-        print(f"[{i + 1}/{len(dois)}] Fetching data for {doi}...")
-        report = aggregate_paper_data(doi)
-        reports.append(report)
+    # Different inputs can still resolve to the same DOI; keep input order
+    dois = list(dict.fromkeys(dois))
+
+    acquire_token()
+
+    # One Semantic Scholar batch call instead of one lookup per paper
+    ss_papers = {}
+    if len(dois) > 1:
+        print(f"Fetching Semantic Scholar data for {len(dois)} papers...", file=sys.stderr)
+        ss_papers = fetch_semantic_scholar_batch(dois)
+
+    # Process the DOIs concurrently; per-host throttling in _request keeps
+    # each API's request rate the same as fetching them one by one
+    with ThreadPoolExecutor(max_workers=MAX_CONCURRENT_PAPERS) as pool:
+        futures = []
+        for i, doi in enumerate(dois):
+            tag = f"[{i + 1}/{len(dois)}]"
+            print(f"{tag} Fetching data for {doi}...", file=sys.stderr)
+            progress_tag = f"{tag} " if len(dois) > 1 else ""
+            futures.append(pool.submit(aggregate_paper_data, doi, ss_papers.get(doi), progress_tag))
+        try:
+            reports = [future.result() for future in futures]
+        except KeyboardInterrupt:
+            _cancel_pool(pool)
+            raise
 
     if args.json:
-        output = reports[0] if len(reports) == 1 else reports
-        print(json.dumps(output, indent=2, ensure_ascii=False, default=str))
+        # Indent for people; compact when piped to a file or jq
+        _write_json(reports[0] if len(reports) == 1 else reports, pretty=sys.stdout.isatty())
         return
 
-    # Generate Markdown
-    all_md = []
-    for report in reports:
-        all_md.append(to_markdown(report))
-
-    md = "\n\n".join(all_md)
-
     if args.output:
         out_path = Path(args.output)
     else:
-        output_dir = Path(__file__).parent / "output"
-        output_dir.mkdir(exist_ok=True)
+        OUTPUT_DIR.mkdir(exist_ok=True)
         if len(reports) == 1:
             cr = reports[0]["sources"].get("crossref", {})
             title_field = cr.get("title", ["report"])
@@ -1024,9 +1462,17 @@ def main():
             name = title or "report"
         else:
             name = f"scholar-report-{len(reports)}-papers"
-        out_path = output_dir / f"{slugify(name)}.md"
-
-    out_path.write_text(md, encoding="utf-8")
+        out_path = OUTPUT_DIR / f"{slugify(name)}.md"
+
+    # Stream the reports to disk one at a time rather than joining them first.
+    # Rendering is tens of microseconds per report, so it stays in-process;
+    # a worker pool costs more in start-up and pickling than it would save.
+    today = datetime.now().strftime("%Y-%m-%d")
+    with out_path.open("wb") as fh:
+        for i, report in enumerate(reports):
+            if i:
+                fh.write(b"\n\n")
+            fh.write(to_markdown(report, today=today).encode("utf-8"))
     print(f"\nReport saved to: {out_path}")
 
 
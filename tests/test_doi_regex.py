@@ -0,0 +1,35 @@
+"""The stdlib and RE2 DOI patterns must find the same DOI in the same text."""
+
+import re
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import scholar  # noqa: E402
+
+re2 = pytest.importorskip("re2")
+
+CASES = [
+    ("doi: 10.1038/nature12373", "10.1038/nature12373"),
+    ("https://doi.org/10.1016/j.cell.2020.01.001.", "10.1016/j.cell.2020.01.001."),
+    ("(10.1126/science.abc1234)", "10.1126/science.abc1234"),
+    ('"10.1093/nar/gkab123", next', "10.1093/nar/gkab123"),
+    ("doi 10.1038/nature12373\xa0Received", "10.1038/nature12373"),  # no-break space
+    ("10.1038/nature12373 Received", "10.1038/nature12373"),  # thin space
+    ("10.1038/nature12373　Received", "10.1038/nature12373"),  # ideographic space
+    ("10.1038/nature12373 Received", "10.1038/nature12373"),  # line separator
+    ("10.1038/nature12373\x85Received", "10.1038/nature12373"),  # NEL
+    ("10.1038/nature12373\x0bReceived", "10.1038/nature12373"),  # vertical tab
+    ("10.1038/nature12373\x1cReceived", "10.1038/nature12373"),  # file separator
+]
+
+
+@pytest.mark.parametrize("text, expected", CASES)
+def test_engines_agree(text, expected):
+    stdlib = re.compile(scholar._DOI_PATTERN, re.IGNORECASE).search(text)
+    linear = re2.compile(scholar._RE2_DOI_PATTERN).search(text)
+    assert stdlib.group(1) == expected
+    assert linear.group(1) == expected